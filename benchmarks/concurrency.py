@@ -0,0 +1,130 @@
+"""Concurrency benchmark: dashboard reads while add_expense writes are in flight.
+
+Each reader and writer is a separate process, like a gunicorn worker. The
+same workload runs against a throwaway database twice - once with the legacy
+rollback journal and once with WAL - and read/write latency percentiles are
+printed for each, so the effect of the connection settings is visible:
+
+    python benchmarks/concurrency.py --writers 4 --readers 8 --seconds 5
+"""
+import argparse
+import multiprocessing
+import os
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app as expense_app  # noqa: E402
+
+
+def percentile(samples, pct):
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def seed(email):
+    client = expense_app.app.test_client()
+    client.post('/register', json={'fullname': 'Bench User', 'matric': email, 'email': email, 'password': 'benchpass'})
+    with expense_app.app.app_context():
+        db = expense_app.get_db()
+        cursor = db.cursor()
+        user_id = cursor.execute("SELECT id FROM users WHERE email = ?", (email,)).fetchone()[0]
+        cursor.execute("INSERT INTO incomes (user_id, amount, description, date) VALUES (?, ?, 'seed', '2026-01-01')",
+                       (user_id, 10 ** 9))
+        expense_app.apply_balance_delta(cursor, user_id, income=10 ** 9)
+        start, end = expense_app.period_bounds('month', date.today())
+        cursor.execute("INSERT INTO budgets (user_id, category, amount, period_start, period_end) VALUES (?, 'Feeding', ?, ?, ?)",
+                       (user_id, 10 ** 9, start, end))
+        db.commit()
+
+
+def logged_in_client(email):
+    client = expense_app.app.test_client()
+    client.post('/login', json={'email': email, 'password': 'benchpass'})
+    return client
+
+
+def worker(email, path, payload, deadline, results):
+    client = logged_in_client(email)
+    samples, errors = [], 0
+    while time.time() < deadline:
+        started = time.perf_counter()
+        if payload is None:
+            response = client.get(path)
+        else:
+            response = client.post(path, json=payload)
+        samples.append((time.perf_counter() - started) * 1000)
+        if response.status_code != 200:
+            errors += 1
+    results.put((path, samples, errors))
+
+
+def run(journal_mode, writers, readers, seconds):
+    workdir = tempfile.mkdtemp(prefix='expense-bench-')
+    expense_app.app.config['DATABASE'] = os.path.join(workdir, 'bench.db')
+    expense_app.app.config['DB_JOURNAL_MODE'] = journal_mode
+    expense_app.init_db()
+
+    emails = [f'writer{i}@bench.local' for i in range(writers)] + [f'reader{i}@bench.local' for i in range(readers)]
+    for email in emails:
+        seed(email)
+
+    results = multiprocessing.Queue()
+    deadline = time.time() + seconds
+    expense = {'amount': 1, 'category': 'Feeding', 'description': 'bench', 'date': date.today().isoformat()}
+    processes = [multiprocessing.Process(target=worker, args=(f'writer{i}@bench.local', '/add_expense', expense,
+                                                              deadline, results)) for i in range(writers)]
+    processes += [multiprocessing.Process(target=worker, args=(f'reader{i}@bench.local', '/get_dashboard_data', None,
+                                                               deadline, results)) for i in range(readers)]
+    for process in processes:
+        process.start()
+    read_samples, write_samples, errors = [], [], 0
+    for _ in processes:
+        path, samples, failed = results.get()
+        (write_samples if path == '/add_expense' else read_samples).extend(samples)
+        errors += failed
+    for process in processes:
+        process.join()
+
+    def summary(samples):
+        return {
+            'requests': len(samples),
+            'per_second': round(len(samples) / seconds, 1),
+            'p50_ms': round(percentile(samples, 50), 2),
+            'p95_ms': round(percentile(samples, 95), 2),
+            'p99_ms': round(percentile(samples, 99), 2),
+            'max_ms': round(max(samples, default=0), 2),
+            'mean_ms': round(statistics.fmean(samples), 2) if samples else 0.0,
+        }
+
+    return {'journal_mode': journal_mode, 'reads': summary(read_samples),
+            'writes': summary(write_samples), 'errors': errors}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--writers', type=int, default=4)
+    parser.add_argument('--readers', type=int, default=8)
+    parser.add_argument('--seconds', type=float, default=5)
+    args = parser.parse_args()
+    # Workers inherit the configured app; fork keeps that cheap on Linux/macOS
+    multiprocessing.set_start_method('fork')
+
+    for journal_mode in ('DELETE', 'WAL'):
+        result = run(journal_mode, args.writers, args.readers, args.seconds)
+        print(f"{result['journal_mode']:>6}: errors={result['errors']}")
+        for kind in ('reads', 'writes'):
+            stats = result[kind]
+            print(f"        {kind:<6} {stats['per_second']:>8}/s  p50={stats['p50_ms']}ms  "
+                  f"p95={stats['p95_ms']}ms  p99={stats['p99_ms']}ms  max={stats['max_ms']}ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+"""Benchmark: the nightly `flask forecast` batch over a large synthetic user base.
+
+Seeds a temporary database with users, daily expense rollups over the
+forecast lookback window and a monthly budget for some categories, then
+times run_forecasts() end to end:
+
+    python benchmarks/forecast_batch.py --users 100000 --density 0.1
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app as expense_app  # noqa: E402
+
+
+def seed(db, users, density, seed_value):
+    rng = random.Random(seed_value)
+    today = date.today()
+    lookback = expense_app.app.config['FORECAST_LOOKBACK_DAYS']
+    days = [(today - timedelta(days=offset)).isoformat() for offset in range(lookback)]
+    month_start, month_end = expense_app.period_bounds('month', today)
+    db.executemany("INSERT INTO users (id, fullname, matric, email, password) VALUES (?, ?, ?, ?, 'x')",
+                   ((i, f'User {i}', f'M{i}', f'user{i}@bench.local') for i in range(1, users + 1)))
+    for first in range(1, users + 1, 1000):
+        rollups, budgets = [], []
+        for user_id in range(first, min(first + 1000, users + 1)):
+            for category in expense_app.CATEGORIES:
+                active = [day for day in days if rng.random() < density]
+                # Amounts are stored in kobo
+                rollups.extend((user_id, day, 'expense', category, rng.randint(10000, 300000), 1)
+                               for day in active)
+                if active and rng.random() < 0.5:
+                    budgets.append((user_id, category, rng.choice((500000, 2000000, 5000000)), month_start, month_end))
+        db.executemany("INSERT INTO rollup_daily (user_id, day, kind, category, amount, count) VALUES (?, ?, ?, ?, ?, ?)",
+                       rollups)
+        db.executemany('''
+            INSERT INTO budgets (user_id, category, amount, period_type, period_start, period_end)
+            VALUES (?, ?, ?, 'month', ?, ?)
+        ''', budgets)
+    db.commit()
+    return db.execute("SELECT COUNT(*) FROM rollup_daily").fetchone()[0]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--users', type=int, default=100000)
+    parser.add_argument('--density', type=float, default=0.1, help='chance of spending in a category on a given day')
+    parser.add_argument('--chunk-users', type=int, default=None)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+    if expense_app.np is None:
+        raise SystemExit("NumPy is required: pip install numpy")
+
+    expense_app.app.config['DATABASE'] = os.path.join(tempfile.mkdtemp(prefix='expense-forecast-'), 'forecast.db')
+    expense_app.init_db()
+    with expense_app.app.app_context():
+        db = expense_app.get_db()
+        started = time.perf_counter()
+        rollups = seed(db, args.users, args.density, args.seed)
+        print(f"seeded users={args.users} rollup_rows={rollups} in {time.perf_counter() - started:.1f}s")
+
+        started = time.perf_counter()
+        users, rows = expense_app.run_forecasts(db, chunk_users=args.chunk_users)
+        elapsed = time.perf_counter() - started
+        print(f"forecast users={users} series={rows} elapsed={elapsed:.1f}s "
+              f"({users / elapsed:,.0f} users/s)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,259 @@
+"""Load test: drive the real routes with a seeded user base and report latency as JSON.
+
+Seeds a database with --users accounts (income, --transactions expenses and
+incomes each, monthly budgets and a goal), then runs a weighted mix of
+/login, /add_expense, /set_budget, /get_dashboard_data,
+/get_all_transactions, /add_to_goal and /payment/callback through the Flask
+test client. With --workers N the virtual users are split across N forked
+processes hitting the same database, like gunicorn workers. Paystack is
+replaced by the local stub, so everything runs offline:
+
+    python benchmarks/load.py --users 200 --transactions 500 --requests 5000 --workers 4 \\
+        --output results.json
+    python benchmarks/load.py ... --compare results.json --max-regression 25
+
+The report holds throughput and p50/p95/p99 latency per route; --compare
+prints the change against an earlier report and exits non-zero if any
+route's p95 grew by more than --max-regression percent.
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app as expense_app  # noqa: E402
+from paystack_stub import start_stub_server  # noqa: E402
+
+PASSWORD = 'loadtest'
+# Relative frequency of each operation in the request mix
+MIX = {
+    'get_dashboard_data': 30,
+    'get_all_transactions': 20,
+    'add_expense': 25,
+    'set_budget': 10,
+    'add_to_goal': 10,
+    'payment_callback': 3,
+    'login': 2,
+}
+
+
+def percentile(samples, pct):
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def seed(users, transactions, rng):
+    """Fills the configured database directly with SQL; returns (user_ids, {user_id: goal_id})."""
+    today = date.today()
+    month_start, month_end = expense_app.period_bounds('month', today)
+    password_hash = expense_app.generate_password_hash(PASSWORD)
+    with expense_app.app.app_context():
+        db = expense_app.get_db()
+        cursor = db.cursor()
+        first = (cursor.execute("SELECT COALESCE(MAX(id), 0) FROM users").fetchone()[0]) + 1
+        user_ids = list(range(first, first + users))
+        cursor.executemany("INSERT INTO users (id, fullname, matric, email, password) VALUES (?, ?, ?, ?, ?)",
+                           [(user_id, f'Load User {user_id}', f'LOAD{user_id}', f'load{user_id}@bench.local',
+                             password_hash) for user_id in user_ids])
+        for user_id in user_ids:
+            # Amounts are stored in kobo
+            expenses, incomes = [], [(user_id, 10 ** 9, 'seed', (today - timedelta(days=365)).isoformat())]
+            for _ in range(transactions):
+                day = (today - timedelta(days=rng.randrange(365))).isoformat()
+                if rng.random() < 0.8:
+                    expenses.append((user_id, rng.randint(5000, 500000), rng.choice(expense_app.CATEGORIES),
+                                     'load', day))
+                else:
+                    incomes.append((user_id, rng.randint(100000, 2000000), 'load', day))
+            cursor.executemany("INSERT INTO expenses (user_id, amount, category, description, date) VALUES (?, ?, ?, ?, ?)",
+                               expenses)
+            cursor.executemany("INSERT INTO incomes (user_id, amount, description, date) VALUES (?, ?, ?, ?)", incomes)
+            cursor.executemany('''
+                INSERT INTO budgets (user_id, category, amount, period_type, period_start, period_end)
+                VALUES (?, ?, ?, 'month', ?, ?)
+            ''', [(user_id, category, 10 ** 8, month_start, month_end) for category in expense_app.CATEGORIES])
+            cursor.execute("INSERT INTO goals (user_id, name, target_amount, current_amount) VALUES (?, 'Laptop', ?, 0)",
+                           (user_id, 10 ** 9))
+        expense_app.rebuild_balances(cursor)
+        expense_app.rebuild_budget_spend(cursor)
+        expense_app.rebuild_rollups(cursor)
+        expense_app.bump_all_revisions(cursor)
+        db.commit()
+        goals = dict(cursor.execute("SELECT user_id, id FROM goals WHERE user_id >= ?", (first,)).fetchall())
+    return user_ids, goals
+
+
+def login(client, user_id):
+    return client.post('/login', json={'email': f'load{user_id}@bench.local', 'password': PASSWORD})
+
+
+def run_operation(name, client, user_id, goal_id, rng, counter):
+    if name == 'login':
+        return login(client, user_id)
+    if name == 'get_dashboard_data':
+        return client.get('/get_dashboard_data')
+    if name == 'get_all_transactions':
+        return client.get('/get_all_transactions')
+    if name == 'add_expense':
+        return client.post('/add_expense', json={'amount': rng.randint(1, 50), 'category': rng.choice(expense_app.CATEGORIES),
+                                                 'description': 'load', 'date': date.today().isoformat()})
+    if name == 'set_budget':
+        return client.post('/set_budget', json={'category': rng.choice(expense_app.CATEGORIES), 'amount': 10 ** 6})
+    if name == 'add_to_goal':
+        return client.post('/add_to_goal', json={'goal_id': goal_id, 'amount': rng.randint(1, 50)})
+    # Unique per process and request, so every callback credits a new payment
+    return client.get(f'/payment/callback?reference=load-{os.getpid()}-{user_id}-{counter}')
+
+
+def worker(user_ids, goals, requests, seed_value, results):
+    rng = random.Random(seed_value)
+    names, weights = zip(*MIX.items())
+    clients = {}
+    samples = {name: [] for name in names}
+    errors = {name: 0 for name in names}
+    started = time.perf_counter()
+    for user_id in user_ids:
+        clients[user_id] = expense_app.app.test_client()
+        begin = time.perf_counter()
+        response = login(clients[user_id], user_id)
+        samples['login'].append((time.perf_counter() - begin) * 1000)
+        errors['login'] += response.status_code != 200
+    for counter in range(requests):
+        user_id = rng.choice(user_ids)
+        name = rng.choices(names, weights)[0]
+        begin = time.perf_counter()
+        response = run_operation(name, clients[user_id], user_id, goals.get(user_id), rng, counter)
+        samples[name].append((time.perf_counter() - begin) * 1000)
+        # Callbacks redirect; business-rule rejections (400) are valid answers, not failures
+        errors[name] += response.status_code >= 500
+    results.put((samples, errors, time.perf_counter() - started))
+
+
+def summarize(samples, errors, elapsed):
+    routes = {}
+    for name in MIX:
+        values = samples.get(name, [])
+        if not values:
+            continue
+        routes[name] = {
+            'requests': len(values),
+            'errors': errors.get(name, 0),
+            'per_second': round(len(values) / elapsed, 1),
+            'mean_ms': round(statistics.fmean(values), 3),
+            'p50_ms': round(percentile(values, 50), 3),
+            'p95_ms': round(percentile(values, 95), 3),
+            'p99_ms': round(percentile(values, 99), 3),
+            'max_ms': round(max(values), 3),
+        }
+    everything = [value for values in samples.values() for value in values]
+    return {
+        'requests': len(everything),
+        'errors': sum(errors.values()),
+        'elapsed_s': round(elapsed, 3),
+        'throughput_rps': round(len(everything) / elapsed, 1),
+        'p50_ms': round(percentile(everything, 50), 3),
+        'p95_ms': round(percentile(everything, 95), 3),
+        'p99_ms': round(percentile(everything, 99), 3),
+        'routes': routes,
+    }
+
+
+def compare(report, baseline_path, max_regression):
+    """Prints per-route p95 changes against an earlier report; returns the routes that regressed."""
+    with open(baseline_path) as f:
+        baseline = json.load(f)
+    regressed = []
+    for name, stats in report['routes'].items():
+        before = baseline.get('routes', {}).get(name)
+        if not before or not before['p95_ms']:
+            continue
+        change = (stats['p95_ms'] - before['p95_ms']) / before['p95_ms'] * 100
+        print(f"{name:<22} p95 {before['p95_ms']:>9.3f}ms -> {stats['p95_ms']:>9.3f}ms ({change:+.1f}%)",
+              file=sys.stderr)
+        if change > max_regression:
+            regressed.append(name)
+    return regressed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--database', help='database to seed and use (default: a throwaway file)')
+    parser.add_argument('--users', type=int, default=50)
+    parser.add_argument('--transactions', type=int, default=200, help='seeded transactions per user')
+    parser.add_argument('--requests', type=int, default=2000, help='total requests across all workers')
+    parser.add_argument('--workers', type=int, default=1, help='worker processes (1 runs in-process)')
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--output', help='also write the JSON report to this file')
+    parser.add_argument('--compare', help='earlier JSON report to compare p95 latencies against')
+    parser.add_argument('--max-regression', type=float, default=20.0, help='allowed p95 growth in percent')
+    args = parser.parse_args()
+    multiprocessing.set_start_method('fork')
+
+    expense_app.app.config['DATABASE'] = args.database or os.path.join(
+        tempfile.mkdtemp(prefix='expense-load-'), 'load.db')
+    expense_app.app.config['SLOW_QUERY_MS'] = float('inf')
+    stub, base_url = start_stub_server(amount=100000)
+    expense_app.app.config['PAYSTACK_BASE_URL'] = base_url
+    expense_app.init_db()
+
+    rng = random.Random(args.seed)
+    started = time.perf_counter()
+    user_ids, goals = seed(args.users, args.transactions, rng)
+    seed_seconds = time.perf_counter() - started
+
+    workers = max(1, min(args.workers, len(user_ids)))
+    per_worker = max(1, args.requests // workers)
+    shards = [user_ids[i::workers] for i in range(workers)]
+    results = multiprocessing.Queue()
+    started = time.perf_counter()
+    if workers == 1:
+        worker(shards[0], goals, per_worker, args.seed, results)
+    else:
+        processes = [multiprocessing.Process(target=worker, args=(shard, goals, per_worker, args.seed + i, results))
+                     for i, shard in enumerate(shards)]
+        for process in processes:
+            process.start()
+    samples, errors = {}, {}
+    for _ in range(workers):
+        worker_samples, worker_errors, _ = results.get()
+        for name, values in worker_samples.items():
+            samples.setdefault(name, []).extend(values)
+            errors[name] = errors.get(name, 0) + worker_errors[name]
+    if workers > 1:
+        for process in processes:
+            process.join()
+    elapsed = time.perf_counter() - started
+    stub.shutdown()
+
+    report = {
+        'config': {'users': args.users, 'transactions_per_user': args.transactions, 'requests': args.requests,
+                   'workers': workers, 'seed': args.seed, 'journal_mode': expense_app.app.config['DB_JOURNAL_MODE']},
+        'seed_s': round(seed_seconds, 3),
+        **summarize(samples, errors, elapsed),
+    }
+    print(json.dumps(report, indent=2))
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+    if args.compare:
+        regressed = compare(report, args.compare, args.max_regression)
+        if regressed:
+            print(f"FAIL: p95 regressed by more than {args.max_regression}% on: {', '.join(regressed)}", file=sys.stderr)
+            raise SystemExit(1)
+    if report['errors']:
+        raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
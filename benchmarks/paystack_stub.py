@@ -0,0 +1,79 @@
+"""A local stand-in for Paystack's transaction verification API.
+
+Answers GET /transaction/verify/<reference> the way Paystack does, so the
+payment callback can be exercised offline:
+
+    python benchmarks/paystack_stub.py --port 8099 --amount 500000
+    PAYSTACK_BASE_URL=http://127.0.0.1:8099 python app.py
+
+References starting with "fail-" verify as unsuccessful. --flaky N makes
+each reference answer 503 N times before succeeding (to exercise retries)
+and --delay adds latency to every response (to exercise timeouts).
+"""
+import argparse
+import json
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+def make_handler(amount, delay, flaky):
+    attempts = Counter()
+    lock = threading.Lock()
+
+    class PaystackStubHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            prefix = '/transaction/verify/'
+            if not self.path.startswith(prefix):
+                return self.respond(404, {'status': False, 'message': 'Not found'})
+            reference = self.path[len(prefix):]
+            if delay:
+                time.sleep(delay)
+            with lock:
+                attempts[reference] += 1
+                attempt = attempts[reference]
+            if attempt <= flaky:
+                return self.respond(503, {'status': False, 'message': 'Service unavailable'})
+            status = 'failed' if reference.startswith('fail-') else 'success'
+            self.respond(200, {
+                'status': True,
+                'message': 'Verification successful',
+                'data': {'reference': reference, 'status': status, 'amount': amount, 'currency': 'NGN'}
+            })
+
+        def respond(self, code, body):
+            payload = json.dumps(body).encode()
+            self.send_response(code)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, format, *args):
+            pass
+
+    return PaystackStubHandler
+
+
+def start_stub_server(port=0, amount=500000, delay=0.0, flaky=0):
+    """Starts the stub on a background thread; returns (server, base_url). Call server.shutdown() to stop."""
+    server = ThreadingHTTPServer(('127.0.0.1', port), make_handler(amount, delay, flaky))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f'http://127.0.0.1:{server.server_address[1]}'
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--port', type=int, default=8099)
+    parser.add_argument('--amount', type=int, default=500000, help='amount in kobo reported for every reference')
+    parser.add_argument('--delay', type=float, default=0.0, help='seconds to wait before answering')
+    parser.add_argument('--flaky', type=int, default=0, help='answer 503 this many times per reference first')
+    args = parser.parse_args()
+    server = ThreadingHTTPServer(('127.0.0.1', args.port), make_handler(args.amount, args.delay, args.flaky))
+    print(f'Paystack stub listening on http://127.0.0.1:{args.port}')
+    server.serve_forever()
+
+
+if __name__ == '__main__':
+    main()
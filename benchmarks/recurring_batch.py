@@ -0,0 +1,85 @@
+"""Benchmark: the `flask process-recurring` batch over a large synthetic rule set.
+
+Seeds a temporary database with users, a starting income, monthly budgets
+and --rules recurring rules (a mix of daily, weekly and monthly incomes and
+expenses, all due), then times run_recurring() for a catch-up of --days days
+and again for a rerun that must post nothing:
+
+    python benchmarks/recurring_batch.py --rules 100000 --users 20000 --days 3
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app as expense_app  # noqa: E402
+
+
+def seed(db, users, rules, days, seed_value):
+    rng = random.Random(seed_value)
+    today = date.today()
+    start = (today - timedelta(days=days - 1)).isoformat()
+    month_start, month_end = expense_app.period_bounds('month', today)
+    db.executemany("INSERT INTO users (id, fullname, matric, email, password) VALUES (?, ?, ?, ?, 'x')",
+                   ((i, f'User {i}', f'M{i}', f'user{i}@bench.local') for i in range(1, users + 1)))
+    # Amounts are stored in kobo
+    db.executemany("INSERT INTO incomes (user_id, amount, description, date) VALUES (?, ?, 'seed', ?)",
+                   ((i, rng.randint(1000000, 10000000), start) for i in range(1, users + 1)))
+    db.executemany('''
+        INSERT INTO budgets (user_id, category, amount, period_type, period_start, period_end)
+        VALUES (?, ?, ?, 'month', ?, ?)
+    ''', ((i, category, rng.choice((500000, 2000000, 5000000)), month_start, month_end)
+          for i in range(1, users + 1) for category in expense_app.CATEGORIES))
+    db.executemany('''
+        INSERT INTO recurring_rules (user_id, kind, amount, category, description, frequency, start_date,
+                                     next_date, created_at)
+        VALUES (?, ?, ?, ?, 'bench', ?, ?, ?, ?)
+    ''', [(user_id, kind, rng.randint(10000, 300000), rng.choice(expense_app.CATEGORIES) if kind == 'expense' else None,
+           rng.choice(expense_app.RECURRING_FREQUENCIES), start, start, start)
+          for user_id, kind in ((rng.randint(1, users), 'expense' if rng.random() < 0.8 else 'income')
+                                for _ in range(rules))])
+    expense_app.rebuild_balances(db.cursor())
+    expense_app.rebuild_budget_spend(db.cursor())
+    db.commit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rules', type=int, default=100000)
+    parser.add_argument('--users', type=int, default=20000)
+    parser.add_argument('--days', type=int, default=3, help='days of downtime to catch up')
+    parser.add_argument('--chunk-users', type=int, default=None)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    expense_app.app.config['DATABASE'] = os.path.join(tempfile.mkdtemp(prefix='expense-recurring-'), 'recurring.db')
+    expense_app.app.config['SLOW_QUERY_MS'] = float('inf')
+    expense_app.init_db()
+    with expense_app.app.app_context():
+        db = expense_app.get_db()
+        started = time.perf_counter()
+        seed(db, args.users, args.rules, args.days, args.seed)
+        print(f"seeded users={args.users} rules={args.rules} in {time.perf_counter() - started:.1f}s")
+
+        started = time.perf_counter()
+        posted, skipped = expense_app.run_recurring(db, chunk_users=args.chunk_users)
+        elapsed = time.perf_counter() - started
+        print(f"catch-up posted={posted} skipped={skipped} elapsed={elapsed:.1f}s "
+              f"({args.rules / elapsed:,.0f} rules/s)")
+
+        started = time.perf_counter()
+        posted, skipped = expense_app.run_recurring(db, chunk_users=args.chunk_users)
+        print(f"rerun posted={posted} skipped={skipped} elapsed={time.perf_counter() - started:.1f}s")
+        mismatches = expense_app.verify_balances(db.cursor())
+        print(f"balance mismatches={len(mismatches)}")
+        if mismatches:
+            raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+"""Benchmark: /search latency over a large transaction history.
+
+Seeds a temporary database with --rows expenses and incomes spread over
+--users accounts, drawing descriptions from a small vocabulary so common
+prefixes match many rows, then times a set of searches for one user through
+the Flask test client:
+
+    python benchmarks/search.py --rows 1000000 --users 1000
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app as expense_app  # noqa: E402
+
+PASSWORD = 'searchbench'
+WORDS = ['cafeteria', 'lunch', 'dinner', 'bus', 'taxi', 'campus', 'textbook', 'printing', 'hostel', 'rent',
+         'data', 'airtime', 'laundry', 'cinema', 'party', 'snacks', 'water', 'fuel', 'photocopy', 'handout']
+QUERIES = ['caf', 'cafeteria lunch', 'bus&category=Transportation', 'ref',
+           'ta&min_amount=100&max_amount=2000', 'print&start=2026-01-01&end=2026-06-30', 'zzz']
+
+
+def seed(db, rows, users, rng):
+    today = date.today()
+    password_hash = expense_app.generate_password_hash(PASSWORD)
+    db.executemany("INSERT INTO users (id, fullname, matric, email, password) VALUES (?, ?, ?, ?, ?)",
+                   ((i, f'User {i}', f'S{i}', f'user{i}@bench.local', password_hash) for i in range(1, users + 1)))
+    for first in range(0, rows, 50000):
+        expenses, incomes = [], []
+        for n in range(first, min(first + 50000, rows)):
+            user_id = rng.randint(1, users)
+            day = (today - timedelta(days=rng.randrange(365))).isoformat()
+            if rng.random() < 0.9:
+                expenses.append((user_id, rng.randint(5000, 500000), rng.choice(expense_app.CATEGORIES),
+                                 ' '.join(rng.sample(WORDS, 3)), day))
+            else:
+                incomes.append((user_id, rng.randint(100000, 2000000), f'Account funding (Ref: T{n})', day))
+        db.executemany("INSERT INTO expenses (user_id, amount, category, description, date) VALUES (?, ?, ?, ?, ?)",
+                       expenses)
+        db.executemany("INSERT INTO incomes (user_id, amount, description, date) VALUES (?, ?, ?, ?)", incomes)
+    db.commit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=1000000)
+    parser.add_argument('--users', type=int, default=1000)
+    parser.add_argument('--repeat', type=int, default=20, help='timed runs per query')
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    expense_app.app.config['DATABASE'] = os.path.join(tempfile.mkdtemp(prefix='expense-search-'), 'search.db')
+    expense_app.app.config['SLOW_QUERY_MS'] = float('inf')
+    expense_app.init_db()
+    with expense_app.app.app_context():
+        started = time.perf_counter()
+        seed(expense_app.get_db(), args.rows, args.users, random.Random(args.seed))
+        print(f"seeded rows={args.rows} users={args.users} in {time.perf_counter() - started:.1f}s")
+
+    client = expense_app.app.test_client()
+    client.post('/login', json={'email': 'user1@bench.local', 'password': PASSWORD})
+    for query in QUERIES:
+        samples = []
+        for run in range(args.repeat):
+            # Vary the page size so every run misses the response cache
+            begin = time.perf_counter()
+            response = client.get(f'/search?q={query}&limit={20 + run}')
+            samples.append((time.perf_counter() - begin) * 1000)
+            assert response.status_code == 200, response.json
+        results = len(response.json['results'])
+        print(f"{query:<42} results={results:<3} p50={statistics.median(samples):7.2f}ms max={max(samples):7.2f}ms")
+
+
+if __name__ == '__main__':
+    main()
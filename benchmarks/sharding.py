@@ -0,0 +1,123 @@
+"""Sharding benchmark: add_expense write throughput by number of shard files.
+
+Each writer is a separate process, like a gunicorn worker, posting
+add_expense for its own user. The same workload runs against a throwaway
+directory database with every user in it (0 shards) and then with the users
+spread over 2 and 4 shard files, so the effect of splitting SQLite's single
+write lock is visible:
+
+    python benchmarks/sharding.py --writers 8 --seconds 5 --shards 0,2,4
+"""
+import argparse
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+from datetime import date
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app as expense_app  # noqa: E402
+
+
+def percentile(samples, pct):
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def seed(email):
+    client = expense_app.app.test_client()
+    client.post('/register', json={'fullname': 'Bench User', 'matric': email, 'email': email, 'password': 'benchpass'})
+    with expense_app.app.app_context():
+        user_id = expense_app.get_directory_db().execute("SELECT id FROM users WHERE email = ?", (email,)).fetchone()[0]
+        db = expense_app.get_db(user_id)
+        cursor = db.cursor()
+        cursor.execute("INSERT INTO incomes (user_id, amount, description, date) VALUES (?, ?, 'seed', '2026-01-01')",
+                       (user_id, 10 ** 9))
+        expense_app.apply_balance_delta(cursor, user_id, income=10 ** 9)
+        start, end = expense_app.period_bounds('month', date.today())
+        cursor.execute("INSERT INTO budgets (user_id, category, amount, period_start, period_end) VALUES (?, 'Feeding', ?, ?, ?)",
+                       (user_id, 10 ** 9, start, end))
+        db.commit()
+
+
+def writer(email, deadline, results):
+    client = expense_app.app.test_client()
+    client.post('/login', json={'email': email, 'password': 'benchpass'})
+    expense = {'amount': 1, 'category': 'Feeding', 'description': 'bench', 'date': date.today().isoformat()}
+    samples, errors = [], 0
+    while time.time() < deadline:
+        started = time.perf_counter()
+        response = client.post('/add_expense', json=expense)
+        samples.append((time.perf_counter() - started) * 1000)
+        if response.status_code != 200:
+            errors += 1
+    results.put((samples, errors))
+
+
+def run(shards, writers, seconds):
+    workdir = tempfile.mkdtemp(prefix='expense-shard-bench-')
+    expense_app.app.config['DATABASE'] = os.path.join(workdir, 'bench.db')
+    expense_app.app.config['SLOW_QUERY_MS'] = float('inf')
+    expense_app.init_db()
+    with expense_app.app.app_context():
+        for _ in range(shards):
+            expense_app.add_shard()
+
+    emails = [f'writer{i}@bench.local' for i in range(writers)]
+    for email in emails:
+        seed(email)
+
+    results = multiprocessing.Queue()
+    deadline = time.time() + seconds
+    processes = [multiprocessing.Process(target=writer, args=(email, deadline, results)) for email in emails]
+    for process in processes:
+        process.start()
+    samples, errors = [], 0
+    for _ in processes:
+        written, failed = results.get()
+        samples.extend(written)
+        errors += failed
+    for process in processes:
+        process.join()
+
+    with expense_app.app.app_context():
+        mismatches = sum(len(expense_app.verify_balances(expense_app.get_connection(path).cursor()))
+                         for path in expense_app.database_paths())
+    return {
+        'shards': shards,
+        'per_second': round(len(samples) / seconds, 1),
+        'p50_ms': round(percentile(samples, 50), 2),
+        'p95_ms': round(percentile(samples, 95), 2),
+        'p99_ms': round(percentile(samples, 99), 2),
+        'errors': errors,
+        'mismatches': mismatches,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--writers', type=int, default=8)
+    parser.add_argument('--seconds', type=float, default=5)
+    parser.add_argument('--shards', default='0,2,4', help='comma-separated shard counts to compare')
+    args = parser.parse_args()
+    # Workers inherit the configured app; fork keeps that cheap on Linux/macOS
+    multiprocessing.set_start_method('fork')
+
+    failed = False
+    for shards in (int(count) for count in args.shards.split(',')):
+        result = run(shards, args.writers, args.seconds)
+        print(f"shards={result['shards']}: {result['per_second']:>8}/s  p50={result['p50_ms']}ms  "
+              f"p95={result['p95_ms']}ms  p99={result['p99_ms']}ms  errors={result['errors']}  "
+              f"mismatches={result['mismatches']}")
+        failed = failed or result['errors'] or result['mismatches']
+    if failed:
+        raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,128 @@
+"""Stress test: concurrent spending from one account must never overdraw it.
+
+Several worker processes, each running several threads, fire add_expense,
+add_to_goal and set_budget requests for the same user at once. Afterwards
+the script checks that the balance never went negative, no category went
+over its budget, and the balance ledger still matches the raw tables.
+Exits non-zero on any violation:
+
+    python benchmarks/stress_balance.py --processes 4 --threads 8 --requests 400
+"""
+import argparse
+import multiprocessing
+import os
+import sys
+import tempfile
+import threading
+from datetime import date
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app as expense_app  # noqa: E402
+
+EMAIL = 'stress@bench.local'
+PASSWORD = 'stresspass'
+STARTING_BALANCE = 1000
+BUDGET = 600
+# Budgets are per period, so spend inside the current month
+TODAY = date.today().isoformat()
+
+
+def seed():
+    client = expense_app.app.test_client()
+    client.post('/register', json={'fullname': 'Stress', 'matric': 'STRESS', 'email': EMAIL, 'password': PASSWORD})
+    client.post('/login', json={'email': EMAIL, 'password': PASSWORD})
+    with expense_app.app.app_context():
+        db = expense_app.get_db()
+        cursor = db.cursor()
+        user_id = cursor.execute("SELECT id FROM users WHERE email = ?", (EMAIL,)).fetchone()[0]
+        cursor.execute("INSERT INTO incomes (user_id, amount, description, date) VALUES (?, ?, 'seed', '2026-01-01')",
+                       (user_id, STARTING_BALANCE * 100))
+        expense_app.apply_balance_delta(cursor, user_id, income=STARTING_BALANCE * 100)
+        db.commit()
+    assert client.post('/set_budget', json={'category': 'Feeding', 'amount': BUDGET}).json['status'] == 'success'
+    assert client.post('/add_goal', json={'name': 'Laptop', 'target_amount': STARTING_BALANCE}).json['status'] == 'success'
+    return user_id
+
+
+def fire(requests_per_thread, thread_index, statuses):
+    client = expense_app.app.test_client()
+    client.post('/login', json={'email': EMAIL, 'password': PASSWORD})
+    for i in range(requests_per_thread):
+        choice = (thread_index + i) % 4
+        if choice == 0:
+            response = client.post('/add_to_goal', json={'goal_id': 1, 'amount': 15})
+        elif choice == 1:
+            response = client.post('/set_budget', json={'category': 'Transportation', 'amount': 50})
+        else:
+            response = client.post('/add_expense', json={'amount': 7, 'category': 'Feeding',
+                                                         'description': 'stress', 'date': TODAY})
+        statuses.append(response.status_code)
+
+
+def process_main(threads, requests_per_thread, results):
+    statuses = []
+    workers = [threading.Thread(target=fire, args=(requests_per_thread, i, statuses)) for i in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    results.put(statuses)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--processes', type=int, default=4)
+    parser.add_argument('--threads', type=int, default=8)
+    parser.add_argument('--requests', type=int, default=400, help='total requests across all workers')
+    args = parser.parse_args()
+    multiprocessing.set_start_method('fork')
+
+    expense_app.app.config['DATABASE'] = os.path.join(tempfile.mkdtemp(prefix='expense-stress-'), 'stress.db')
+    expense_app.init_db()
+    user_id = seed()
+
+    per_thread = max(1, args.requests // (args.processes * args.threads))
+    results = multiprocessing.Queue()
+    processes = [multiprocessing.Process(target=process_main, args=(args.threads, per_thread, results))
+                 for _ in range(args.processes)]
+    for process in processes:
+        process.start()
+    statuses = []
+    for _ in processes:
+        statuses.extend(results.get())
+    for process in processes:
+        process.join()
+
+    failures = []
+    with expense_app.app.app_context():
+        cursor = expense_app.get_db().cursor()
+        income, expenses, goals, balance = expense_app.get_balance(cursor, user_id)
+        feeding = cursor.execute("SELECT COALESCE(SUM(amount), 0) FROM expenses WHERE user_id = ? AND category = 'Feeding'",
+                                 (user_id,)).fetchone()[0]
+        goal = cursor.execute("SELECT current_amount, target_amount FROM goals WHERE id = 1").fetchone()
+        mismatches = expense_app.verify_balances(cursor)
+    if balance < 0:
+        failures.append(f"balance went negative: {balance}")
+    if feeding > BUDGET * 100:
+        failures.append(f"Feeding spend {feeding} kobo exceeds budget {BUDGET * 100}")
+    if goal['current_amount'] > goal['target_amount']:
+        failures.append(f"goal overfunded: {goal['current_amount']} > {goal['target_amount']}")
+    if mismatches:
+        failures.append(f"ledger drift: {mismatches}")
+    server_errors = [status for status in statuses if status >= 500]
+    if server_errors:
+        failures.append(f"{len(server_errors)} request(s) failed with a server error")
+
+    print(f"requests={len(statuses)} ok={statuses.count(200)} rejected={statuses.count(400)} "
+          f"errors={len(server_errors)}")
+    print(f"income={income} expenses={expenses} goals={goals} balance={balance} feeding_spend={feeding} (kobo)")
+    if failures:
+        for failure in failures:
+            print(f"FAIL: {failure}")
+        raise SystemExit(1)
+    print("OK: no overspending under concurrency.")
+
+
+if __name__ == '__main__':
+    main()
@@ -10,6 +10,25 @@ function formatCurrency(number) {
 }
 // ### END OF NEW FUNCTION ###
 
+// Remembers the last ETag and body per URL and revalidates with If-None-Match,
+// so polling an unchanged endpoint costs a bodiless 304 and no re-render.
+const etagCache = new Map();
+
+async function conditionalFetch(url) {
+    const cached = etagCache.get(url);
+    const headers = cached ? { "If-None-Match": cached.etag } : {};
+    const res = await fetch(url, { headers, cache: "no-store" });
+    if (res.status === 304 && cached) {
+        return { data: cached.data, changed: false };
+    }
+    const data = await res.json();
+    const etag = res.headers.get("ETag");
+    if (etag && data.status === "success") {
+        etagCache.set(url, { etag, data });
+    }
+    return { data, changed: true };
+}
+
 document.addEventListener("DOMContentLoaded", () => {
     // === DOM Elements ===
     const totalBalanceEl = document.getElementById("totalBalance");
@@ -45,67 +64,158 @@ document.addEventListener("DOMContentLoaded", () => {
     });
 
     // === Core Data Fetching & UI Rendering ===
+    // Latest dashboard payload and stored forecasts, so either can re-render the budgets
+    let lastDashboard = null;
+    let forecastsByCategory = {};
+    let lastGoals = null;
+    // Revision of the user's data this page reflects (see applyDelta)
+    let revision = 0;
+
+    function renderDashboard(data) {
+        lastDashboard = data;
+        // ### UPDATED WITH formatCurrency ###
+        totalBalanceEl.textContent = `₦${formatCurrency(data.total_balance)}`;
+        totalIncomeEl.textContent = `₦${formatCurrency(data.total_income)}`;
+        totalExpensesEl.textContent = `₦${formatCurrency(data.total_expenses)}`;
+        
+        updateSpendingChart(data.spending_by_category);
+        displayBudgets(data.budgets, data.budget_spent || {}, data.budget_periods || {});
+    }
+
     async function fetchDashboardData() {
         try {
-            const res = await fetch("/get_dashboard_data");
-            const data = await res.json();
-            if (data.status === "success") {
-                // ### UPDATED WITH formatCurrency ###
-                totalBalanceEl.textContent = `₦${formatCurrency(data.total_balance)}`;
-                totalIncomeEl.textContent = `₦${formatCurrency(data.total_income)}`;
-                totalExpensesEl.textContent = `₦${formatCurrency(data.total_expenses)}`;
-                
-                updateSpendingChart(data.spending_by_category);
-                displayBudgets(data.budgets, data.spending_by_category);
+            const { data, changed } = await conditionalFetch("/get_dashboard_data");
+            if (changed && data.status === "success") {
+                renderDashboard(data);
             }
         } catch (error) {
             console.error("Error fetching dashboard data:", error);
         }
     }
     
-    async function fetchAndDisplayTransactions() {
+    // Transactions are loaded a page at a time from /transactions; the next
+    // page is requested when the sentinel below the list scrolls into view.
+    let transactionsCursor = null;
+    let transactionsLoading = false;
+    let transactionsExhausted = false;
+    let transactionsGeneration = 0;
+    const transactionsSentinel = document.createElement("div");
+    transactionsSentinel.className = "transactions-sentinel";
+
+    function renderTransaction(transaction) {
+        const transactionDiv = document.createElement("div");
+        const isExpense = transaction.type === 'expense';
+        transactionDiv.classList.add("transaction-item", isExpense ? "expense-item" : "income-item");
+        transactionDiv.dataset.key = `${transaction.type}-${transaction.id}`;
+        transactionDiv.dataset.date = transaction.date;
+        transactionDiv.dataset.type = transaction.type;
+        transactionDiv.dataset.id = transaction.id;
+        
+        // ### UPDATED WITH formatCurrency ###
+        const amountText = isExpense ? 
+            `<span class="transaction-amount">-₦${formatCurrency(transaction.amount)}</span>` :
+            `<span class="transaction-amount">+₦${formatCurrency(transaction.amount)}</span>`;
+        
+        const transactionIcon = isExpense ? 
+            `<i class="fas fa-arrow-down transaction-icon"></i>` :
+            `<i class="fas fa-arrow-up transaction-icon"></i>`;
+        
+        transactionDiv.innerHTML = `
+            <div class="transaction-details">
+                ${transactionIcon}
+                <div class="transaction-info">
+                    <span class="transaction-description">${transaction.description || transaction.category || 'Income'}</span>
+                    <span class="transaction-date">${transaction.date}</span>
+                </div>
+            </div>
+            ${amountText}
+        `;
+        return transactionDiv;
+    }
+
+    function appendTransactionsPage(data, firstPage) {
+        if (firstPage) {
+            recentTransactionsList.innerHTML = "";
+            if (data.transactions.length === 0) {
+                recentTransactionsList.innerHTML = `<p class="no-data-message">No transactions yet.</p>`;
+            }
+        }
+        data.transactions.forEach(transaction => {
+            recentTransactionsList.appendChild(renderTransaction(transaction));
+        });
+        transactionsCursor = data.next_cursor;
+        transactionsExhausted = !data.next_cursor;
+        if (!transactionsExhausted) {
+            recentTransactionsList.appendChild(transactionsSentinel);
+        } else {
+            transactionsSentinel.remove();
+        }
+    }
+
+    // Loads the page after the last one shown (triggered by scrolling)
+    async function loadTransactionsPage() {
+        if (transactionsLoading || transactionsExhausted || !transactionsCursor) return;
+        transactionsLoading = true;
+        const generation = transactionsGeneration;
         try {
-            const res = await fetch("/get_all_transactions");
+            const res = await fetch(`/transactions?cursor=${encodeURIComponent(transactionsCursor)}`);
             const data = await res.json();
+            if (generation !== transactionsGeneration) return; // list was reset meanwhile
             if (data.status === "success") {
-                recentTransactionsList.innerHTML = "";
-                if (data.transactions.length === 0) {
-                    recentTransactionsList.innerHTML = `<p class="no-data-message">No transactions yet.</p>`;
-                } else {
-                    data.transactions.forEach(transaction => {
-                        const transactionDiv = document.createElement("div");
-                        const isExpense = transaction.type === 'expense';
-                        transactionDiv.classList.add("transaction-item", isExpense ? "expense-item" : "income-item");
-                        
-                        // ### UPDATED WITH formatCurrency ###
-                        const amountText = isExpense ? 
-                            `<span class="transaction-amount">-₦${formatCurrency(transaction.amount)}</span>` :
-                            `<span class="transaction-amount">+₦${formatCurrency(transaction.amount)}</span>`;
-                        
-                        const transactionIcon = isExpense ? 
-                            `<i class="fas fa-arrow-down transaction-icon"></i>` :
-                            `<i class="fas fa-arrow-up transaction-icon"></i>`;
-                        
-                        transactionDiv.innerHTML = `
-                            <div class="transaction-details">
-                                ${transactionIcon}
-                                <div class="transaction-info">
-                                    <span class="transaction-description">${transaction.description || transaction.category || 'Income'}</span>
-                                    <span class="transaction-date">${transaction.date}</span>
-                                </div>
-                            </div>
-                            ${amountText}
-                        `;
-                        recentTransactionsList.appendChild(transactionDiv);
-                    });
-                }
+                appendTransactionsPage(data, false);
             } else {
                 recentTransactionsList.innerHTML = `<p>${data.message}</p>`;
             }
         } catch (error) {
             console.error("Error fetching transactions:", error);
+        } finally {
+            if (generation === transactionsGeneration) transactionsLoading = false;
         }
     }
+
+    // Revalidates the newest page (e.g. after adding an expense); the list is
+    // only rebuilt when the server reports that it changed.
+    async function fetchAndDisplayTransactions() {
+        try {
+            const { data, changed } = await conditionalFetch("/transactions");
+            if (!changed) return;
+            // Discard any older page still in flight before rebuilding the list
+            transactionsGeneration++;
+            transactionsLoading = false;
+            if (data.status === "success") {
+                appendTransactionsPage(data, true);
+            } else {
+                recentTransactionsList.innerHTML = `<p>${data.message}</p>`;
+            }
+        } catch (error) {
+            console.error("Error fetching transactions:", error);
+        }
+    }
+
+    // Lists are ordered by (date, type, id), newest first, like /transactions
+    function isNewer(transaction, item) {
+        if (transaction.date !== item.date) return transaction.date > item.date;
+        if (transaction.type !== item.type) return transaction.type > item.type;
+        return transaction.id > Number(item.id);
+    }
+
+    // Puts a pushed transaction at its place in the list, unless it belongs
+    // to a page that has not been loaded yet (scrolling will reach it)
+    function insertTransaction(transaction) {
+        if (recentTransactionsList.querySelector(`[data-key="${transaction.type}-${transaction.id}"]`)) return;
+        const items = Array.from(recentTransactionsList.querySelectorAll(".transaction-item"));
+        const before = items.find(item => isNewer(transaction, item.dataset));
+        if (!before && !transactionsExhausted) return;
+        const placeholder = recentTransactionsList.querySelector(".no-data-message");
+        if (placeholder) placeholder.remove();
+        recentTransactionsList.insertBefore(renderTransaction(transaction), before || null);
+    }
+
+    if ("IntersectionObserver" in window) {
+        new IntersectionObserver(entries => {
+            if (entries.some(entry => entry.isIntersecting)) loadTransactionsPage();
+        }, { rootMargin: "200px" }).observe(transactionsSentinel);
+    }
     
     function updateSpendingChart(spendingData) {
         const ctx = document.getElementById("spendingChart").getContext("2d");
@@ -138,7 +248,7 @@ document.addEventListener("DOMContentLoaded", () => {
         });
     }
 
-    function displayBudgets(budgets, spending) {
+    function displayBudgets(budgets, spending, periods) {
         budgetList.innerHTML = "";
         let hasBudgets = false;
         for (const category in budgets) {
@@ -146,6 +256,8 @@ document.addEventListener("DOMContentLoaded", () => {
                 hasBudgets = true;
                 const budgetAmount = budgets[category];
                 const spentAmount = spending[category] || 0;
+                const period = periods[category];
+                const periodLabel = period ? ` (${period.type === "week" ? "this week" : period.type === "month" ? "this month" : `${period.start} – ${period.end}`})` : "";
                 
                 // Ensure budgetAmount is not zero to avoid division by zero
                 const progress = budgetAmount > 0 ? (spentAmount / budgetAmount) * 100 : 0;
@@ -154,16 +266,21 @@ document.addEventListener("DOMContentLoaded", () => {
                 budgetItem.classList.add("budget-item");
                 
                 const progressClass = progress > 100 ? "over" : "";
+                const forecast = forecastsByCategory[category];
+                const forecastLine = forecast ? `
+                    <div class="budget-forecast ${forecast.projected_overrun > 0 ? "over" : ""}">
+                        Projected ₦${formatCurrency(forecast.projected)} by ${forecast.period_end}${forecast.projected_overrun > 0 ? ` — ₦${formatCurrency(forecast.projected_overrun)} over budget` : ""}
+                    </div>` : "";
                 
                 // ### UPDATED WITH formatCurrency ###
                 budgetItem.innerHTML = `
                     <div class="budget-info">
-                        <span class="budget-category-label">${category}</span>
+                        <span class="budget-category-label">${category}${periodLabel}</span>
                         <span class="budget-amounts">₦${formatCurrency(spentAmount)} / ₦${formatCurrency(budgetAmount)}</span>
                     </div>
                     <div class="budget-progress-bar">
                         <div class="budget-progress ${progressClass}" style="width: ${Math.min(progress, 100)}%;"></div>
-                    </div>
+                    </div>${forecastLine}
                 `;
                 budgetList.appendChild(budgetItem);
             }
@@ -173,39 +290,58 @@ document.addEventListener("DOMContentLoaded", () => {
         }
     }
 
-    async function fetchAndDisplayGoals() {
+    async function fetchForecasts() {
         try {
-            const res = await fetch("/get_goals");
-            const data = await res.json();
+            const { data, changed } = await conditionalFetch("/forecast");
+            if (changed && data.status === "success") {
+                forecastsByCategory = Object.fromEntries(data.forecasts.map(f => [f.category, f]));
+                if (lastDashboard) {
+                    displayBudgets(lastDashboard.budgets, lastDashboard.budget_spent || {}, lastDashboard.budget_periods || {});
+                }
+            }
+        } catch (error) {
+            console.error("Error fetching forecasts:", error);
+        }
+    }
 
-            goalsList.innerHTML = "";
-            if (data.status === "success" && data.goals.length > 0) {
-                fundGoalSelect.innerHTML = data.goals.map(goal => 
-                    `<option value="${goal.id}">${goal.name}</option>`
-                ).join('');
+    function renderGoals(data) {
+        lastGoals = data;
+        goalsList.innerHTML = "";
+        if (data.status === "success" && data.goals.length > 0) {
+            fundGoalSelect.innerHTML = data.goals.map(goal => 
+                `<option value="${goal.id}">${goal.name}</option>`
+            ).join('');
 
-                data.goals.forEach(goal => {
-                    const goalItem = document.createElement("div");
-                    goalItem.classList.add("budget-item");
-                    
-                    const progress = (goal.current_amount / goal.target_amount) * 100;
-                    const progressClass = progress >= 100 ? "over" : "";
-                    
-                    // ### UPDATED WITH formatCurrency ###
-                    goalItem.innerHTML = `
-                        <div class="budget-info">
-                            <span class="budget-category-label">${goal.name}</span>
-                            <span class="budget-amounts">₦${formatCurrency(goal.current_amount)} / ₦${formatCurrency(goal.target_amount)}</span>
-                        </div>
-                        <div class="budget-progress-bar">
-                            <div class="budget-progress ${progressClass}" style="width: ${Math.min(progress, 100)}%;"></div>
-                        </div>
-                        <button class="btn btn-primary add-fund-btn" data-goal-id="${goal.id}" data-goal-name="${goal.name}"><i class="fas fa-coins"></i> Add Funds</button>
-                    `;
-                    goalsList.appendChild(goalItem);
-                });
-            } else {
-                goalsList.innerHTML = `<p class="no-data-message">No goals set yet.</p>`;
+            data.goals.forEach(goal => {
+                const goalItem = document.createElement("div");
+                goalItem.classList.add("budget-item");
+                
+                const progress = (goal.current_amount / goal.target_amount) * 100;
+                const progressClass = progress >= 100 ? "over" : "";
+                
+                // ### UPDATED WITH formatCurrency ###
+                goalItem.innerHTML = `
+                    <div class="budget-info">
+                        <span class="budget-category-label">${goal.name}</span>
+                        <span class="budget-amounts">₦${formatCurrency(goal.current_amount)} / ₦${formatCurrency(goal.target_amount)}</span>
+                    </div>
+                    <div class="budget-progress-bar">
+                        <div class="budget-progress ${progressClass}" style="width: ${Math.min(progress, 100)}%;"></div>
+                    </div>
+                    <button class="btn btn-primary add-fund-btn" data-goal-id="${goal.id}" data-goal-name="${goal.name}"><i class="fas fa-coins"></i> Add Funds</button>
+                `;
+                goalsList.appendChild(goalItem);
+            });
+        } else {
+            goalsList.innerHTML = `<p class="no-data-message">No goals set yet.</p>`;
+        }
+    }
+
+    async function fetchAndDisplayGoals() {
+        try {
+            const { data, changed } = await conditionalFetch("/get_goals");
+            if (changed) {
+                renderGoals(data);
             }
         } catch (error) {
             console.error("Error fetching goals:", error);
@@ -213,6 +349,60 @@ document.addEventListener("DOMContentLoaded", () => {
         }
     }
 
+    // === Live Updates ===
+    // Every write answers with a delta (the changed totals, budgets, goals and
+    // new transactions) and the same delta is pushed to the user's other tabs
+    // over /events. Deltas hold absolute values, so one that arrives both ways
+    // is simply skipped; a gap in revisions means one was missed, and a
+    // `resync` delta means the change was too large to describe - in both
+    // cases the views are revalidated instead.
+    function resync() {
+        fetchDashboardData();
+        fetchAndDisplayTransactions();
+        fetchAndDisplayGoals();
+    }
+
+    function applyDelta(delta) {
+        if (!delta || delta.revision <= revision) return;
+        const missed = delta.revision > revision + 1;
+        revision = delta.revision;
+        if (delta.resync || missed) {
+            resync();
+            return;
+        }
+        if (delta.dashboard && lastDashboard) {
+            const { spending_by_category, budgets, budget_spent, budget_periods, ...totals } = delta.dashboard;
+            const spending = { ...lastDashboard.spending_by_category, ...spending_by_category };
+            for (const category in spending_by_category) {
+                if (!spending_by_category[category]) delete spending[category];
+            }
+            renderDashboard({
+                ...lastDashboard,
+                ...totals,
+                spending_by_category: spending,
+                budgets: { ...lastDashboard.budgets, ...budgets },
+                budget_spent: { ...(lastDashboard.budget_spent || {}), ...budget_spent },
+                budget_periods: { ...(lastDashboard.budget_periods || {}), ...budget_periods }
+            });
+        }
+        (delta.transactions || []).forEach(insertTransaction);
+        if (delta.goals && lastGoals) {
+            const goals = (lastGoals.goals || []).slice();
+            delta.goals.forEach(goal => {
+                const index = goals.findIndex(existing => existing.id === goal.id);
+                if (index >= 0) goals[index] = goal; else goals.push(goal);
+            });
+            renderGoals({ ...lastGoals, status: "success", goals });
+        }
+    }
+
+    function subscribeToUpdates() {
+        if (!("EventSource" in window)) return;
+        // The browser reconnects on its own and then sends Last-Event-ID
+        const events = new EventSource(`/events?revision=${revision}`);
+        events.addEventListener("delta", e => applyDelta(JSON.parse(e.data)));
+    }
+
     // === Event Listeners for Forms and Buttons ===
 
     document.addEventListener("click", (e) => {
@@ -239,8 +429,7 @@ document.addEventListener("DOMContentLoaded", () => {
                 if (data.status === "success") {
                     form.reset();
                     fundGoalModal.style.display = 'none';
-                    fetchAndDisplayGoals();
-                    fetchDashboardData();
+                    applyDelta(data.delta);
                 }
             } catch (error) {
                 showModal('An error occurred. Please try again.');
@@ -278,8 +467,7 @@ document.addEventListener("DOMContentLoaded", () => {
                 
                 if (data.status === "success") {
                     form.reset();
-                    fetchDashboardData();
-                    fetchAndDisplayTransactions();
+                    applyDelta(data.delta);
                 }
             } catch (error) {
                 showModal('An error occurred. Please try again.');
@@ -297,14 +485,15 @@ document.addEventListener("DOMContentLoaded", () => {
                     headers: { "Content-Type": "application/json" },
                     body: JSON.stringify({
                         category: form.budgetCategory.value,
-                        amount: parseFloat(form.budgetAmount.value)
+                        amount: parseFloat(form.budgetAmount.value),
+                        period: form.budgetPeriod.value
                     })
                 });
                 const data = await res.json();
                 showModal(data.message); // This will show "Insufficient Balance!" error
                 if (data.status === "success") {
                     form.reset();
-                    fetchDashboardData();
+                    applyDelta(data.delta);
                 }
             } catch(error) {
                 showModal('An error occurred. Please try again.');
@@ -329,7 +518,7 @@ document.addEventListener("DOMContentLoaded", () => {
                 showModal(data.message);
                 if (data.status === "success") {
                     form.reset();
-                    fetchAndDisplayGoals();
+                    applyDelta(data.delta);
                 }
             } catch (error) {
                 showModal('An error occurred. Please try again.');
@@ -352,9 +541,7 @@ document.addEventListener("DOMContentLoaded", () => {
                     
                     if (data.status === "success") {
                         showModal(data.message);
-                        setTimeout(() => {
-                            location.reload(); 
-                        }, 2000);
+                        applyDelta(data.delta);
                     } else {
                         showModal(data.message);
                     }
@@ -400,7 +587,27 @@ document.addEventListener("DOMContentLoaded", () => {
     }
     
     // === Initial Data Load ===
-    fetchDashboardData();
-    fetchAndDisplayTransactions();
-    fetchAndDisplayGoals();
+    // index() embeds the whole initial state in the page; fall back to
+    // /api/bootstrap (one request instead of three) if it is missing.
+    async function loadInitialData() {
+        const embedded = document.getElementById("bootstrapData");
+        let bootstrap = embedded ? JSON.parse(embedded.textContent) : null;
+        try {
+            if (!bootstrap) {
+                const res = await fetch("/api/bootstrap");
+                bootstrap = await res.json();
+            }
+            if (bootstrap.status !== "success") return;
+            revision = bootstrap.revision || 0;
+            renderDashboard(bootstrap.dashboard);
+            appendTransactionsPage(bootstrap.transactions, true);
+            renderGoals(bootstrap.goals);
+        } catch (error) {
+            console.error("Error loading dashboard:", error);
+        }
+        fetchForecasts();
+        subscribeToUpdates();
+    }
+
+    loadInitialData();
 });
\ No newline at end of file
@@ -0,0 +1,31 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app as expense_app  # noqa: E402
+
+
+@pytest.fixture
+def app_db(tmp_path):
+    """Points the app at a fresh, migrated database for one test."""
+    previous = expense_app.app.config['DATABASE']
+    expense_app.app.config['DATABASE'] = str(tmp_path / 'test.db')
+    expense_app.init_db()
+    yield expense_app
+    expense_app.app.config['DATABASE'] = previous
+
+
+@pytest.fixture
+def client(app_db):
+    """A test client logged in as a newly registered user; the user's id is in client.user_id."""
+    client = app_db.app.test_client()
+    client.post('/register', json={'fullname': 'Test User', 'matric': 'TEST1', 'email': 'user@test.local',
+                                   'password': 'testpass'})
+    client.post('/login', json={'email': 'user@test.local', 'password': 'testpass'})
+    with app_db.app.app_context():
+        client.user_id = app_db.get_directory_db().execute(
+            "SELECT id FROM users WHERE email = 'user@test.local'").fetchone()[0]
+    return client
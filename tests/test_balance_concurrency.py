@@ -0,0 +1,87 @@
+"""Concurrent spending from one account must never overdraw it (see benchmarks/stress_balance.py)."""
+import threading
+from datetime import date
+
+EMAIL = 'concurrency@test.local'
+PASSWORD = 'testpass'
+TODAY = date.today().isoformat()
+
+
+def seed(expense_app, income):
+    client = expense_app.app.test_client()
+    client.post('/register', json={'fullname': 'Test', 'matric': 'TEST', 'email': EMAIL, 'password': PASSWORD})
+    with expense_app.app.app_context():
+        user_id = expense_app.get_directory_db().execute("SELECT id FROM users WHERE email = ?", (EMAIL,)).fetchone()[0]
+        db = expense_app.get_db(user_id)
+        cursor = db.cursor()
+        cursor.execute("INSERT INTO incomes (user_id, amount, description, date) VALUES (?, ?, 'seed', ?)",
+                       (user_id, expense_app.to_kobo(income), TODAY))
+        expense_app.apply_balance_delta(cursor, user_id, income=expense_app.to_kobo(income))
+        db.commit()
+    return user_id
+
+
+def logged_in_client(expense_app):
+    client = expense_app.app.test_client()
+    client.post('/login', json={'email': EMAIL, 'password': PASSWORD})
+    return client
+
+
+def spend_concurrently(expense_app, threads, requests_per_thread, expense):
+    statuses = []
+    ready = threading.Barrier(threads)
+
+    def fire():
+        client = logged_in_client(expense_app)
+        ready.wait()
+        for _ in range(requests_per_thread):
+            statuses.append(client.post('/add_expense', json=expense).status_code)
+
+    workers = [threading.Thread(target=fire) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return statuses
+
+
+def ledger(expense_app, user_id):
+    with expense_app.app.app_context():
+        cursor = expense_app.get_db(user_id).cursor()
+        return expense_app.get_balance(cursor, user_id), expense_app.verify_balances(cursor)
+
+
+def test_concurrent_expenses_never_overdraw_balance(app_db):
+    user_id = seed(app_db, income=1000)
+    client = logged_in_client(app_db)
+    # A budget is required to spend; moving 900 into a goal leaves the balance as the tighter limit
+    assert client.post('/set_budget', json={'category': 'Feeding', 'amount': 1000}).json['status'] == 'success'
+    goal_id = client.post('/add_goal', json={'name': 'Laptop', 'target_amount': 900}).json['delta']['goals'][0]['id']
+    assert client.post('/add_to_goal', json={'goal_id': goal_id, 'amount': 900}).json['status'] == 'success'
+    expense = {'amount': 7, 'category': 'Feeding', 'description': 'test', 'date': TODAY}
+
+    statuses = spend_concurrently(app_db, threads=8, requests_per_thread=10, expense=expense)
+
+    (income, expenses, goals, balance), mismatches = ledger(app_db, user_id)
+    assert all(status in (200, 400) for status in statuses)
+    # 14 expenses of 7 fit into 100; every later one must be rejected
+    assert statuses.count(200) == 14
+    assert expenses == app_db.to_kobo(98)
+    assert balance >= 0
+    assert mismatches == []
+
+
+def test_concurrent_expenses_never_exceed_budget(app_db):
+    user_id = seed(app_db, income=1000)
+    client = logged_in_client(app_db)
+    assert client.post('/set_budget', json={'category': 'Feeding', 'amount': 50}).json['status'] == 'success'
+    expense = {'amount': 7, 'category': 'Feeding', 'description': 'test', 'date': TODAY}
+
+    statuses = spend_concurrently(app_db, threads=8, requests_per_thread=5, expense=expense)
+
+    (income, expenses, goals, balance), mismatches = ledger(app_db, user_id)
+    assert all(status in (200, 400) for status in statuses)
+    assert statuses.count(200) == 7
+    assert expenses == app_db.to_kobo(49)
+    assert balance >= 0
+    assert mismatches == []
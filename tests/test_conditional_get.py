@@ -0,0 +1,26 @@
+"""Read endpoints answer 304 only while the client's ETag still matches the revision and variant."""
+from datetime import date
+
+
+def test_etag_matches_until_the_next_write(client):
+    client.post('/import_transactions', json=[{'type': 'income', 'amount': 100, 'date': '2026-01-01'}])
+    first = client.get('/get_dashboard_data')
+    etag = first.headers['ETag']
+
+    assert client.get('/get_dashboard_data', headers={'If-None-Match': etag}).status_code == 304
+
+    client.post('/set_budget', json={'category': 'Feeding', 'amount': 50})
+    client.post('/add_expense', json={'amount': 5, 'category': 'Feeding', 'date': date.today().isoformat()})
+    assert client.get('/get_dashboard_data', headers={'If-None-Match': etag}).status_code == 200
+
+
+def test_etag_depends_on_the_query_string(client):
+    etag = client.get('/transactions?limit=5').headers['ETag']
+    assert client.get('/transactions?limit=5', headers={'If-None-Match': etag}).status_code == 304
+    assert client.get('/transactions?limit=6', headers={'If-None-Match': etag}).status_code == 200
+
+
+def test_if_modified_since_alone_never_answers_304(client):
+    client.post('/import_transactions', json=[{'type': 'income', 'amount': 100, 'date': '2026-01-01'}])
+    response = client.get('/transactions?limit=5', headers={'If-Modified-Since': 'Fri, 01 Jan 2100 00:00:00 GMT'})
+    assert response.status_code == 200
@@ -0,0 +1,91 @@
+"""Bulk import must apply the same balance and budget rules, in order, as /add_expense."""
+
+
+def feeding(amount, day):
+    return {'amount': amount, 'category': 'Feeding', 'date': day}
+
+
+def set_up(client, income, budgets):
+    """Funds the user and sets custom Feeding budgets given as (amount, start, end)."""
+    response = client.post('/import_transactions', json=[{'type': 'income', 'amount': income, 'date': '2026-01-01'}])
+    assert response.json['status'] == 'success'
+    for amount, start, end in budgets:
+        response = client.post('/set_budget', json={'category': 'Feeding', 'amount': amount, 'period': 'custom',
+                                                    'start': start, 'end': end})
+        assert response.json['status'] == 'success'
+
+
+def state(app_db, user_id):
+    """Returns (balance, {period_start: spent}, ledger mismatches) in kobo."""
+    with app_db.app.app_context():
+        cursor = app_db.get_db(user_id).cursor()
+        spent = dict(cursor.execute("SELECT period_start, spent FROM budgets WHERE user_id = ?", (user_id,)).fetchall())
+        return app_db.get_balance(cursor, user_id)[3], spent, app_db.verify_balances(cursor)
+
+
+def test_rejected_row_does_not_count_towards_later_rows(app_db, client):
+    set_up(client, income=1000, budgets=[(100, '2026-01-01', '2026-01-31')])
+
+    response = client.post('/import_transactions?skip_invalid=1',
+                           json=[feeding(60, '2026-01-10'), feeding(50, '2026-01-11'), feeding(40, '2026-01-12')])
+
+    assert response.json['imported_expenses'] == 2
+    assert [error['row'] for error in response.json['errors']] == [2]
+    balance, spent, mismatches = state(app_db, client.user_id)
+    assert balance == app_db.to_kobo(900)
+    assert spent == {'2026-01-01': app_db.to_kobo(100)}
+    assert mismatches == []
+
+
+def test_rejected_row_does_not_count_against_balance(app_db, client):
+    set_up(client, income=100, budgets=[(100, '2026-01-01', '2026-01-31')])
+    # Funding a goal leaves 40 to spend while the budget still has 100
+    goal_id = client.post('/add_goal', json={'name': 'Laptop', 'target_amount': 60}).json['delta']['goals'][0]['id']
+    client.post('/add_to_goal', json={'goal_id': goal_id, 'amount': 60})
+
+    response = client.post('/import_transactions?skip_invalid=1',
+                           json=[feeding(30, '2026-01-10'), feeding(20, '2026-01-11'), feeding(10, '2026-01-12')])
+
+    assert response.json['imported_expenses'] == 2
+    assert response.json['errors'][0]['row'] == 2
+    assert response.json['errors'][0]['message'].startswith('Insufficient Funds!')
+    balance, _, mismatches = state(app_db, client.user_id)
+    assert balance == 0
+    assert mismatches == []
+
+
+def test_batch_with_errors_imports_nothing(app_db, client):
+    set_up(client, income=1000, budgets=[(100, '2026-01-01', '2026-01-31')])
+    before = state(app_db, client.user_id)
+
+    response = client.post('/import_transactions', json=[
+        feeding(10, '2026-01-10'),
+        {'type': 'income', 'amount': 500, 'date': '2026-01-10'},
+        feeding(20, 'not-a-date'),
+    ])
+
+    assert response.status_code == 400
+    assert [error['row'] for error in response.json['errors']] == [3]
+    assert state(app_db, client.user_id) == before
+    assert client.get('/transactions').json['transactions'] == [
+        {'amount': 1000.0, 'category': None, 'date': '2026-01-01', 'description': '', 'id': 1, 'type': 'income'}]
+
+
+def test_overlapping_budgets_are_each_enforced(app_db, client):
+    # A month-long and a week-long period, as a monthly and a weekly budget overlap
+    set_up(client, income=1000, budgets=[(100, '2026-01-01', '2026-01-31'), (80, '2026-01-12', '2026-01-18')])
+    rows = [feeding(70, '2026-01-14'), feeding(50, '2026-01-05')]
+
+    response = client.post('/import_transactions', json=rows)
+    assert response.status_code == 400
+    assert response.json['errors'] == [{'row': 2, 'message': 'Budget Exceeded! You only have ₦30.00 left in your '
+                                                            '"Feeding" budget for this period.'}]
+
+    response = client.post('/import_transactions?skip_invalid=1', json=rows)
+    assert response.json['imported_expenses'] == 1
+    _, spent, mismatches = state(app_db, client.user_id)
+    assert spent == {'2026-01-01': app_db.to_kobo(70), '2026-01-12': app_db.to_kobo(70)}
+    assert mismatches == []
+    # /add_expense applies the same rule
+    response = client.post('/add_expense', json=feeding(50, '2026-01-05'))
+    assert response.json['message'] == 'Budget Exceeded! You only have ₦30.00 left in your "Feeding" budget for this period.'
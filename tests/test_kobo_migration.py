@@ -0,0 +1,48 @@
+"""Migration 10 converts the REAL naira money columns to INTEGER kobo."""
+import sqlite3
+
+import pytest
+
+import app as expense_app
+
+
+@pytest.fixture
+def naira_db(tmp_path, monkeypatch):
+    """A database migrated only up to the last naira schema version (9), with one user's data."""
+    kobo = next(i for i, (version, _, _) in enumerate(expense_app.MIGRATIONS) if version == 10)
+    db = sqlite3.connect(str(tmp_path / 'naira.db'))
+    monkeypatch.setattr(expense_app, 'MIGRATIONS', expense_app.MIGRATIONS[:kobo])
+    expense_app.run_migrations(db)
+    monkeypatch.undo()
+    db.execute("INSERT INTO users (id, fullname, matric, email, password) VALUES (1, 'A', 'M1', 'a@test.local', 'x')")
+    db.executemany("INSERT INTO incomes (user_id, amount, description, date) VALUES (1, ?, 'pay', ?)",
+                   [(1500.75, '2026-10-01'), (1.15, '2026-10-02')])
+    db.executemany("INSERT INTO expenses (user_id, amount, category, description, date) VALUES (1, ?, 'Feeding', 'meal', ?)",
+                   [(200.2, '2026-10-02'), (0.29, '2026-10-03')])
+    db.execute("INSERT INTO budgets (user_id, category, amount, period_start, period_end, spent) "
+               "VALUES (1, 'Feeding', 999.99, '2026-10-01', '2026-10-31', 200.49)")
+    db.execute("INSERT INTO goals (user_id, name, target_amount, current_amount) VALUES (1, 'Laptop', 350.5, 12.34)")
+    db.commit()
+    yield db
+    db.close()
+
+
+def money(db, table, column):
+    return [row[0] for row in db.execute(f"SELECT {column} FROM {table} ORDER BY rowid")]
+
+
+def test_amounts_become_old_value_times_100(naira_db):
+    before = {(table, column): money(naira_db, table, column)
+              for table, column in (('incomes', 'amount'), ('expenses', 'amount'), ('budgets', 'amount'),
+                                    ('goals', 'target_amount'), ('goals', 'current_amount'))}
+
+    assert 10 in expense_app.run_migrations(naira_db)
+
+    for (table, column), values in before.items():
+        migrated = money(naira_db, table, column)
+        assert all(isinstance(value, int) for value in migrated)
+        assert migrated == [round(value * 100) for value in values]
+    assert expense_app.verify_balances(naira_db.cursor()) == []
+    assert naira_db.execute("SELECT total_income, total_expenses, total_goals_funded FROM user_balances").fetchone() \
+        == (150190, 20049, 1234)
+    assert money(naira_db, 'budgets', 'spent') == [20049]
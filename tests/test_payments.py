@@ -0,0 +1,97 @@
+"""A Paystack reference is credited once, to one user, however often its callback is replayed."""
+import threading
+
+import pytest
+
+REFERENCE = 'T123456789'
+
+
+@pytest.fixture
+def paystack(app_db, monkeypatch):
+    """Stands in for Paystack: every reference is a successful NGN 2,500 payment."""
+    calls = []
+
+    def verify(reference):
+        calls.append(reference)
+        return {'status': 'success', 'reference': reference, 'amount': 250000}
+
+    monkeypatch.setattr(app_db, 'verify_paystack_transaction', verify)
+    return calls
+
+
+def register(app_db, name):
+    client = app_db.app.test_client()
+    client.post('/register', json={'fullname': name, 'matric': name, 'email': f'{name}@test.local',
+                                   'password': 'testpass'})
+    client.post('/login', json={'email': f'{name}@test.local', 'password': 'testpass'})
+    with app_db.app.app_context():
+        client.user_id = app_db.get_directory_db().execute(
+            "SELECT id FROM users WHERE email = ?", (f'{name}@test.local',)).fetchone()[0]
+    return client
+
+
+def funding(app_db, user_id):
+    """Returns (funding incomes, total income in the ledger, ledger mismatches) for the user."""
+    with app_db.app.app_context():
+        cursor = app_db.get_db(user_id).cursor()
+        incomes = cursor.execute("SELECT amount, description FROM incomes WHERE user_id = ?", (user_id,)).fetchall()
+        return [tuple(row) for row in incomes], app_db.get_balance(cursor, user_id)[0], app_db.verify_balances(cursor)
+
+
+def test_replayed_callback_credits_once(app_db, client, paystack):
+    for _ in range(3):
+        assert client.get(f'/payment/callback?reference={REFERENCE}').status_code == 302
+
+    incomes, total_income, mismatches = funding(app_db, client.user_id)
+    assert incomes == [(250000, f'Account funding (Ref: {REFERENCE})')]
+    assert total_income == 250000
+    assert mismatches == []
+
+
+def test_reference_cannot_be_credited_to_another_user(app_db, client, paystack):
+    client.get(f'/payment/callback?reference={REFERENCE}')
+    # On its own shard, the other user's payments table has never seen the reference
+    with app_db.app.app_context():
+        app_db.add_shard()
+    other = register(app_db, 'other')
+    assert app_db.user_database_path(other.user_id) != app_db.user_database_path(client.user_id)
+
+    other.get(f'/payment/callback?reference={REFERENCE}')
+
+    assert funding(app_db, other.user_id)[:2] == ([], 0)
+    assert funding(app_db, client.user_id)[1] == 250000
+
+
+def test_concurrent_callbacks_credit_once(app_db, client, paystack):
+    ready = threading.Barrier(4)
+
+    def replay():
+        replayer = app_db.app.test_client()
+        replayer.post('/login', json={'email': 'user@test.local', 'password': 'testpass'})
+        ready.wait()
+        replayer.get(f'/payment/callback?reference={REFERENCE}')
+
+    workers = [threading.Thread(target=replay) for _ in range(4)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    incomes, total_income, mismatches = funding(app_db, client.user_id)
+    assert len(paystack) == 4
+    assert len(incomes) == 1
+    assert total_income == 250000
+    assert mismatches == []
+
+
+def test_replay_after_moving_shards_credits_once(app_db, client, paystack):
+    client.get(f'/payment/callback?reference={REFERENCE}')
+    with app_db.app.app_context():
+        app_db.move_users([client.user_id], app_db.add_shard())
+
+    client.get(f'/payment/callback?reference={REFERENCE}')
+
+    incomes, total_income, mismatches = funding(app_db, client.user_id)
+    assert len(incomes) == 1
+    assert total_income == 250000
+    assert mismatches == []
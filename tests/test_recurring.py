@@ -0,0 +1,60 @@
+"""Catching up on recurring rules posts each occurrence once, however often the scheduler runs."""
+from datetime import date, timedelta
+
+TODAY = date.today()
+
+
+def add_rules(client):
+    """Funds the user, sets a 30 Feeding budget for the next month and adds a daily income and expense."""
+    assert client.post('/import_transactions', json=[
+        {'type': 'income', 'amount': 1000, 'date': TODAY.isoformat()}]).json['status'] == 'success'
+    assert client.post('/set_budget', json={'category': 'Feeding', 'amount': 30, 'period': 'custom',
+                                            'start': TODAY.isoformat(),
+                                            'end': (TODAY + timedelta(days=30)).isoformat()}).json['status'] == 'success'
+    for rule in ({'type': 'income', 'amount': 5, 'description': 'allowance'},
+                 {'type': 'expense', 'amount': 7, 'category': 'Feeding', 'description': 'lunch'}):
+        response = client.post('/add_recurring', json=dict(rule, frequency='daily', start_date=TODAY.isoformat()))
+        assert response.json['posted'] == 1
+
+
+def ledger(app_db, user_id):
+    """Returns (occurrence count, expense count, income count, budget spent, mismatches) for the user."""
+    with app_db.app.app_context():
+        cursor = app_db.get_db(user_id).cursor()
+
+        def count(sql):
+            return cursor.execute(sql, (user_id,)).fetchone()[0]
+
+        return (count("SELECT COUNT(*) FROM recurring_occurrences WHERE rule_id IN "
+                      "(SELECT id FROM recurring_rules WHERE user_id = ?)"),
+                count("SELECT COUNT(*) FROM expenses WHERE user_id = ?"),
+                count("SELECT COUNT(*) FROM incomes WHERE user_id = ?"),
+                count("SELECT spent FROM budgets WHERE user_id = ?"),
+                app_db.verify_balances(cursor))
+
+
+def run(app_db, user_id, today, chunk_users=None):
+    with app_db.app.app_context():
+        return app_db.run_recurring(app_db.get_db(user_id), today, chunk_users)
+
+
+def test_second_run_posts_nothing(app_db, client):
+    add_rules(client)
+
+    # Ten days of catch-up: every allowance, and lunches until the budget runs out
+    assert run(app_db, client.user_id, TODAY + timedelta(days=10)) == (10 + 3, 7)
+    after_first = ledger(app_db, client.user_id)
+    assert after_first == (22, 4, 12, 2800, [])
+
+    assert run(app_db, client.user_id, TODAY + timedelta(days=10)) == (0, 0)
+    assert ledger(app_db, client.user_id) == after_first
+
+
+def test_catch_up_in_steps_matches_one_run(app_db, client):
+    add_rules(client)
+
+    for days in range(1, 11):
+        run(app_db, client.user_id, TODAY + timedelta(days=days), chunk_users=1)
+    assert run(app_db, client.user_id, TODAY + timedelta(days=10), chunk_users=1) == (0, 0)
+
+    assert ledger(app_db, client.user_id) == (22, 4, 12, 2800, [])
@@ -0,0 +1,101 @@
+"""Moving users between shard files must keep every user's data and ledger intact."""
+from datetime import date, timedelta
+
+USERS = 5
+
+
+def register(app_db, n):
+    """Registers user n and gives them incomes, expenses, a funded goal and a recurring rule."""
+    client = app_db.app.test_client()
+    email = f'shard{n}@test.local'
+    client.post('/register', json={'fullname': f'User {n}', 'matric': f'SHARD{n}', 'email': email,
+                                   'password': 'testpass'})
+    client.post('/login', json={'email': email, 'password': 'testpass'})
+    income = [{'type': 'income', 'amount': 1000 + n, 'date': '2026-01-01'}]
+    assert client.post('/import_transactions', json=income).json['status'] == 'success'
+    assert client.post('/set_budget', json={'category': 'Feeding', 'amount': 500, 'period': 'custom',
+                                            'start': '2026-01-01', 'end': '2026-01-31'}).json['status'] == 'success'
+    expenses = [{'amount': 10 + i, 'category': 'Feeding', 'description': f'meal {i}', 'date': f'2026-01-{10 + i:02d}'}
+                for i in range(n + 1)]
+    assert client.post('/import_transactions', json=expenses).json['status'] == 'success'
+    goal_id = client.post('/add_goal', json={'name': 'Laptop', 'target_amount': 300}).json['delta']['goals'][0]['id']
+    assert client.post('/add_to_goal', json={'goal_id': goal_id, 'amount': 25 + n}).json['status'] == 'success'
+    start = (date.today() - timedelta(days=n)).isoformat()
+    response = client.post('/add_recurring', json={'type': 'income', 'amount': 5, 'description': f'allowance {n}',
+                                                   'frequency': 'daily', 'start_date': start})
+    assert response.json['posted'] == n + 1
+
+
+def snapshot(app_db):
+    """Every user's data as seen through their home shard, without the (renumbered) ids."""
+    with app_db.app.app_context():
+        users = [row[0] for row in app_db.get_directory_db().execute("SELECT id FROM users ORDER BY id")]
+        data = {}
+        for user_id in users:
+            cursor = app_db.get_db(user_id).cursor()
+            data[user_id] = (
+                app_db.get_balance(cursor, user_id),
+                cursor.execute("SELECT amount, category, description, date FROM expenses WHERE user_id = ? "
+                               "ORDER BY id", (user_id,)).fetchall(),
+                cursor.execute("SELECT amount, description, date FROM incomes WHERE user_id = ? ORDER BY id",
+                               (user_id,)).fetchall(),
+                cursor.execute("SELECT name, target_amount, current_amount FROM goals WHERE user_id = ?",
+                               (user_id,)).fetchall(),
+                cursor.execute("SELECT category, period_start, spent FROM budgets WHERE user_id = ?",
+                               (user_id,)).fetchall(),
+                # Occurrences must still point at their rule and at the income they posted
+                cursor.execute('''
+                    SELECT r.description, o.occurrence_date, i.amount, i.date FROM recurring_occurrences o
+                    JOIN recurring_rules r ON r.id = o.rule_id LEFT JOIN incomes i ON i.id = o.transaction_id
+                    WHERE r.user_id = ? ORDER BY o.occurrence_date
+                ''', (user_id,)).fetchall(),
+            )
+        return data
+
+
+def mismatches(app_db):
+    with app_db.app.app_context():
+        return sum(len(app_db.verify_balances(app_db.get_connection(path).cursor()))
+                   for path in app_db.database_paths())
+
+
+def shard_counts(app_db):
+    with app_db.app.app_context():
+        return dict(app_db.get_directory_db().execute(
+            "SELECT shard_id, COUNT(*) FROM users GROUP BY shard_id").fetchall())
+
+
+def test_rebalance_and_split_keep_data_and_ledgers(app_db):
+    for n in range(USERS):
+        register(app_db, n)
+    before = snapshot(app_db)
+    runner = app_db.app.test_cli_runner()
+
+    assert runner.invoke(args=['add-shards', '2']).exit_code == 0
+    assert runner.invoke(args=['rebalance-shards']).exit_code == 0
+    assert sorted(shard_counts(app_db).items()) == [(1, 3), (2, 2)]
+    assert mismatches(app_db) == 0
+    assert snapshot(app_db) == before
+
+    assert runner.invoke(args=['split-shard', '1']).exit_code == 0
+    assert sorted(shard_counts(app_db).items()) == [(1, 2), (2, 2), (3, 1)]
+    assert mismatches(app_db) == 0
+    assert snapshot(app_db) == before
+    with app_db.app.app_context():
+        assert app_db.purge_orphans() == 0
+
+
+def test_move_users_back_to_directory(app_db):
+    for n in range(USERS):
+        register(app_db, n)
+    before = snapshot(app_db)
+
+    with app_db.app.app_context():
+        shard_id = app_db.add_shard()
+        assert app_db.move_users([1, 2, 3], shard_id) == 3
+        # Moving onto a file that already holds other users' rows renumbers the ids
+        assert app_db.move_users([1, 2], None) == 2
+
+    assert shard_counts(app_db) == {None: USERS - 1, shard_id: 1}
+    assert mismatches(app_db) == 0
+    assert snapshot(app_db) == before